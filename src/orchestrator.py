@@ -4,16 +4,30 @@ Test Suite Orchestrator GRMP
 Orchestrates test execution in Docker containers and combines JUnit XML reports.
 """
 
+import json
+import logging
 import os
+import queue
 import re
+import sys
+import threading
 import yaml
 import docker
-import time
+from collections import Counter, OrderedDict
+from logging.handlers import QueueHandler, QueueListener
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, TimeoutError, as_completed
 from pathlib import Path
-from typing import Dict, List, Any
-from junitparser import JUnitXml
+from typing import Dict, List, Any, Optional, Tuple
+from lxml import etree
 import warnings
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+log = logging.getLogger("grmp")
+
 class SecretRef:
     """Sentinel object representing a !secret tag reference in a YAML config."""
     def __init__(self, name: str):
@@ -31,21 +45,249 @@ def _secret_constructor(loader, node):
     return SecretRef(loader.construct_scalar(node))
 
 
-class _SecretLoader(yaml.SafeLoader):
-    """SafeLoader subclass that understands the !secret tag."""
+class _SecretLoader(_SafeLoader):
+    """SafeLoader subclass (libyaml-backed when available) that understands the !secret tag."""
     pass
 
 
 _SecretLoader.add_constructor("!secret", _secret_constructor)
 
 
+# Parsed YAML files keyed on path, validated against (st_mtime_ns, st_size).
+_YAML_CACHE_MAX_ENTRIES = 100
+_YAML_CACHE: "OrderedDict[str, Tuple[int, int, Any]]" = OrderedDict()
+_CACHE_MISS = object()
+
+# Buffer size for reading individual reports and writing the combined report
+_REPORT_IO_BUFFER_SIZE = 1 << 20
+
+# Network modes a test may request with its 'network' key
+_NETWORK_MODES = ('bridge', 'none', 'host')
+
+# Bytes of a failed container's stderr kept for the error and the log
+_STDERR_LOG_LIMIT = 4096
+
+# Lines of stderr fetched from a failed container
+_STDERR_TAIL_LINES = 200
+
+# Seconds between container state checks while waiting for an exit event
+_EXIT_POLL_SECONDS = 30
+
+# Below this many uncached files, parsing in-process beats starting a process pool.
+_PARALLEL_PARSE_MIN_FILES = 16
+
+# Opt-in JSON sidecar (<file>.yaml.json) reused while it is newer than its YAML source.
+_JSON_SIDECAR_ENV = "GRMP_YAML_JSON_CACHE"
+_JSON_SECRET_KEY = "__grmp_secret__"
+
+
+def _json_default(obj):
+    """Encode SecretRef values for the JSON sidecar cache."""
+    if isinstance(obj, SecretRef):
+        return {_JSON_SECRET_KEY: obj.name}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_object_hook(obj: Dict[str, Any]) -> Any:
+    """Decode SecretRef values from the JSON sidecar cache."""
+    if len(obj) == 1 and _JSON_SECRET_KEY in obj:
+        return SecretRef(obj[_JSON_SECRET_KEY])
+    return obj
+
+
+def _has_non_str_keys(obj: Any) -> bool:
+    """Check for mapping keys that JSON would silently turn into strings."""
+    if isinstance(obj, dict):
+        return any(not isinstance(key, str) or _has_non_str_keys(value) for key, value in obj.items())
+    if isinstance(obj, list):
+        return any(_has_non_str_keys(item) for item in obj)
+    return False
+
+
+def _read_json_sidecar(sidecar: Path, source_mtime_ns: int) -> Any:
+    """Return the sidecar contents if it is at least as new as its source, else _CACHE_MISS."""
+    try:
+        if sidecar.stat().st_mtime_ns < source_mtime_ns:
+            return _CACHE_MISS
+        return json.loads(sidecar.read_bytes(), object_hook=_json_object_hook)
+    except (OSError, ValueError):
+        return _CACHE_MISS
+
+
+def _write_json_sidecar(sidecar: Path, config: Any) -> Optional[str]:
+    """
+    Write the sidecar; configs that cannot be stored as JSON are skipped.
+    Returns a description of the failure, or None on success.
+    """
+    if _has_non_str_keys(config):
+        return f"Could not write JSON cache {sidecar}: config has non-string mapping keys"
+    try:
+        sidecar.write_bytes(json.dumps(config, default=_json_default).encode())
+    except (OSError, TypeError, ValueError) as e:
+        return f"Could not write JSON cache {sidecar}: {e}"
+    return None
+
+
+def _iter_yaml_files(root: Path):
+    """Yield paths of all .yaml/.yml files under root in a single directory walk."""
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            if filename.endswith((".yaml", ".yml")):
+                yield os.path.join(dirpath, filename)
+
+
+def _yaml_cache_get(config_file: Path, stat: os.stat_result) -> Any:
+    """Return the cached parse of config_file if it is still current, else _CACHE_MISS."""
+    key = str(config_file)
+    cached = _YAML_CACHE.get(key)
+    if cached is None or cached[:2] != (stat.st_mtime_ns, stat.st_size):
+        return _CACHE_MISS
+    _YAML_CACHE.move_to_end(key)
+    return cached[2]
+
+
+def _yaml_cache_put(config_file: Path, stat: os.stat_result, config: Any) -> None:
+    """Store a parsed config file, evicting the least recently used entry when full."""
+    key = str(config_file)
+    _YAML_CACHE[key] = (stat.st_mtime_ns, stat.st_size, config)
+    _YAML_CACHE.move_to_end(key)
+    if len(_YAML_CACHE) > _YAML_CACHE_MAX_ENTRIES:
+        _YAML_CACHE.popitem(last=False)
+
+
+def _parse_config_file(config_file: Path, mtime_ns: int) -> Tuple[Any, Optional[str]]:
+    """
+    Parse a YAML config file, going through the JSON sidecar when enabled.
+    Module-level so it can be run in worker processes. Nothing is logged here,
+    as records from worker processes would be lost; instead a warning message
+    is returned alongside the config for the caller to log.
+    """
+    use_sidecar = os.getenv(_JSON_SIDECAR_ENV) == "1"
+    sidecar = config_file.with_suffix(config_file.suffix + ".json")
+    config = _read_json_sidecar(sidecar, mtime_ns) if use_sidecar else _CACHE_MISS
+    warning = None
+    if config is _CACHE_MISS:
+        with open(config_file, "rb") as f:
+            config = yaml.load(f, Loader=_SecretLoader)
+        if use_sidecar:
+            warning = _write_json_sidecar(sidecar, config)
+    return config, warning
+
+
+def _build_test_env(test_name: str, test_config: Dict[str, Any]) -> Tuple[Dict[str, str], List[str]]:
+    """
+    Translate a test's config into container environment variables.
+    Returns the plain variables and the names of the SECRET_* variables to
+    resolve from the orchestrator's environment when the test runs.
+    """
+    # TEST_ prefix separates test parameters from system environment variables
+    env_vars = {
+        'TS_NAME': test_name,
+    }
+    secret_names = []
+
+    if test_config:
+        for key, value in test_config.items():
+            if key == 'source_file':
+                env_vars['SPECIAL_SOURCE_FILE'] = str(value)
+            elif key == 'create-issue':
+                env_vars['SPECIAL_CREATE_ISSUE'] = 'true' if str(value).lower() == 'true' else 'false'
+            elif isinstance(value, SecretRef):
+                secret_names.append(f'SECRET_{value.name}')
+            elif key != 'image':
+                env_vars[f'TEST_{key.upper()}'] = str(value)
+
+    return env_vars, secret_names
+
+
+class _ContainerExitWatcher:
+    """
+    Resolves a Future per container from a single Docker 'die' event stream,
+    so waiting tests don't each hold an API connection open with container.wait().
+    """
+
+    def __init__(self, client: docker.DockerClient):
+        self._pending: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+        # Subscribed here, before any container is started, so no exit is missed
+        self._events = client.events(decode=True, filters={'type': 'container', 'event': 'die'})
+        self._thread = threading.Thread(target=self._listen, name='container-exit-watcher', daemon=True)
+        self._thread.start()
+
+    def register(self, container_id: str) -> Optional[Future]:
+        """
+        Return a Future for the container's exit code. Must be called before starting it.
+        Returns None once the event stream has ended, as no exit would be reported.
+        """
+        future = Future()
+        with self._lock:
+            if self._closed:
+                return None
+            self._pending[container_id] = future
+        return future
+
+    def discard(self, container_id: str) -> None:
+        """Stop tracking a container whose exit was observed some other way."""
+        with self._lock:
+            self._pending.pop(container_id, None)
+
+    def _listen(self) -> None:
+        reason = "closed"
+        try:
+            for event in self._events:
+                container_id = event.get('Actor', {}).get('ID') or event.get('id')
+                with self._lock:
+                    future = self._pending.pop(container_id, None)
+                if future is not None:
+                    exit_code = event.get('Actor', {}).get('Attributes', {}).get('exitCode', -1)
+                    future.set_result(int(exit_code))
+        except Exception as e:
+            reason = f"failed: {e}"
+        finally:
+            # Anything still pending falls back to waiting on the container directly
+            with self._lock:
+                self._closed = True
+                pending, self._pending = self._pending, {}
+            for future in pending.values():
+                future.set_exception(RuntimeError(f"Docker event stream {reason}"))
+
+    def close(self) -> None:
+        """
+        Stop listening and release the event stream.
+        Failures are only logged: tests have already finished by now, and teardown
+        must not stop their reports from being combined.
+        """
+        try:
+            self._events.close()
+        except Exception as e:
+            # e.g. docker-py cannot cancel streams over ssh://; the daemon thread is left behind
+            log.warning("Could not close Docker event stream: %s", e)
+            return
+        self._thread.join(timeout=5)
+
+
 class TestOrchestrator:
     def __init__(self, config_dir: str = None, reports_dir: str = None):
         """Initialize the orchestrator with configuration and reports directories."""
         self.config_dir = Path(config_dir or os.getenv('CONFIG_DIR', '/config'))
         self.reports_dir = Path(reports_dir or '/reports')
         
-        self.client = docker.from_env()
+        # Number of test containers run concurrently
+        self.max_parallel = max(1, int(os.getenv('GRMP_MAX_PARALLEL', '4')))
+
+        # One API connection per concurrent test plus one for the event stream
+        self.client = docker.from_env(
+            max_pool_size=max(docker.constants.DEFAULT_MAX_POOL_SIZE, self.max_parallel + 1)
+        )
+
+        # Per-image locks so concurrent tests pull a shared image only once
+        self._pull_locks: Dict[str, threading.Lock] = {}
+        self._pull_locks_guard = threading.Lock()
+        self._pulled_images = set()
+
+        # Set by run() while tests execute; run_test falls back to container.wait() without it
+        self._exit_watcher = None
         
         self.config_dir.mkdir(parents=True, exist_ok=True)
         self.reports_dir.mkdir(parents=True, exist_ok=True)
@@ -59,7 +301,7 @@ class TestOrchestrator:
         """
         env_path = os.getenv('REPORTS_HOST_PATH')
         if env_path:
-            print(f"Using REPORTS_HOST_PATH from environment: {env_path}")
+            log.info("Using REPORTS_HOST_PATH from environment: %s", env_path)
             return env_path
         
         try:
@@ -71,14 +313,14 @@ class TestOrchestrator:
                 for mount in mounts:
                     if mount.get('Destination') == '/reports':
                         host_path = mount.get('Source')
-                        print(f"Detected host path from container mounts: {host_path}")
+                        log.info("Detected host path from container mounts: %s", host_path)
                         return host_path
         except Exception as e:
-            print(f"Could not detect host path from container: {e}")
+            log.warning("Could not detect host path from container: %s", e)
         
         # Fallback: assume we're running locally
         fallback_path = str(self.reports_dir.absolute())
-        print(f"Using fallback path: {fallback_path}")
+        log.info("Using fallback path: %s", fallback_path)
         return fallback_path
 
     def _build_provenance(self, yaml_file: Path) -> str:
@@ -102,30 +344,78 @@ class TestOrchestrator:
         return str(relative_path)
 
     def load_config(self, config_file: Path) -> Dict[str, Any]:
-        """Load a single YAML configuration file."""
+        """
+        Load a single YAML configuration file.
+        Parsed files are cached in memory and reused as long as the file's
+        mtime and size are unchanged. The returned object is shared with the
+        cache, so callers must not modify it.
+        When GRMP_YAML_JSON_CACHE=1, a JSON copy of the parsed file is kept
+        next to it and read instead of the YAML while it is up to date.
+        """
         if not config_file.exists():
             raise FileNotFoundError(f"Configuration file not found: {config_file}")
-        
-        with open(config_file, "r") as f:
-            config = yaml.load(f, Loader=_SecretLoader)
 
-        print(f"Loaded configuration from {config_file}")
+        stat = os.stat(config_file)
+        config = _yaml_cache_get(config_file, stat)
+        if config is not _CACHE_MISS:
+            log.info("Loaded configuration from %s (cached)", config_file)
+            return config
+
+        config, warning = _parse_config_file(config_file, stat.st_mtime_ns)
+        if warning:
+            log.warning("%s", warning)
+        _yaml_cache_put(config_file, stat, config)
+
+        log.info("Loaded configuration from %s", config_file)
         return config
 
+    def _parse_configs_in_parallel(self, yaml_files: List[Path]) -> Dict[Path, Any]:
+        """
+        Parse uncached config files in a process pool and add them to the YAML cache.
+        Returns the parsed configs by path; returns nothing when there are too few
+        uncached files for a process pool to pay off.
+        """
+        pending = []
+        for yaml_file in yaml_files:
+            stat = os.stat(yaml_file)
+            if _yaml_cache_get(yaml_file, stat) is _CACHE_MISS:
+                pending.append((yaml_file, stat))
+
+        if len(pending) < _PARALLEL_PARSE_MIN_FILES:
+            return {}
+
+        parsed: Dict[Path, Any] = {}
+        with ProcessPoolExecutor() as executor:
+            results = executor.map(
+                _parse_config_file,
+                [yaml_file for yaml_file, _ in pending],
+                [stat.st_mtime_ns for _, stat in pending],
+                chunksize=8,
+            )
+            for (yaml_file, stat), (config, warning) in zip(pending, results):
+                if warning:
+                    log.warning("%s", warning)
+                _yaml_cache_put(yaml_file, stat, config)
+                parsed[yaml_file] = config
+                log.info("Loaded configuration from %s", yaml_file)
+        return parsed
 
     def load_all_configs(self) -> Dict[str, Any]:
         """Recursively load all YAML files under config_dir, merge them into one config."""
-        yaml_files = sorted(list(self.config_dir.rglob("*.yaml")) + list(self.config_dir.rglob("*.yml")))
+        yaml_files = sorted(Path(path) for path in _iter_yaml_files(self.config_dir))
 
         if not yaml_files:
             raise FileNotFoundError(f"No YAML files found under {self.config_dir}")
 
+        parsed_configs = self._parse_configs_in_parallel(yaml_files)
+
         combined_config: Dict[str, Any] = {"tests": {}}
-        test_name_counts: Dict[str, int] = {}
+        test_name_counts: Counter = Counter()
+        renames: List[str] = []
 
         for yaml_file in yaml_files:
-            # Reuse load_config for loading each file
-            config = self.load_config(yaml_file)
+            # Files not parsed in parallel go through load_config
+            config = parsed_configs[yaml_file] if yaml_file in parsed_configs else self.load_config(yaml_file)
 
             if not config or "tests" not in config:
                 continue  # skip files without tests
@@ -134,81 +424,137 @@ class TestOrchestrator:
                 original_name = test_name
 
                 # Handle duplicates, names are treated as opaque strings, 'input-echo-standard-2' is not considered a variant of 'input-echo-standard'
-                count = test_name_counts.get(original_name, 0)
+                count = test_name_counts[original_name]
                 if count > 0:
                     candidate = f"{original_name}({count + 1})"
                     while candidate in combined_config["tests"]:
                         count += 1
                         candidate = f"{original_name}({count + 1})"
                     test_name = candidate
-                    warnings.warn(
-                        f"Duplicate test name '{original_name}' found in {yaml_file}. "
-                        f"Renaming to '{test_name}'.",
-                        stacklevel=2
-                    )
+                    renames.append(f"'{original_name}' in {yaml_file} renamed to '{test_name}'")
 
                 test_name_counts[original_name] = count + 1
                 test_name_counts[test_name] = 1
 
-                # Ensure 'config' node exists and add provenance and issue creation flag
-                test_data["config"] = test_data.get("config") or {}
-                test_data["config"]["source_file"] = self._build_provenance(yaml_file)
-                test_data["config"].setdefault("create-issue", False)
+                # Ensure 'config' node exists and add provenance and issue creation flag.
+                # New dicts are built because test_data is shared with the YAML cache.
+                test_config = {**(test_data.get("config") or {}), "source_file": self._build_provenance(yaml_file)}
+                test_config.setdefault("create-issue", False)
+
+                combined_config["tests"][test_name] = {
+                    **test_data,
+                    "config": test_config,
+                    "_env": _build_test_env(test_name, test_config),
+                }
 
-                combined_config["tests"][test_name] = test_data
+            log.info("Processed tests from %s", yaml_file)
 
-            print(f"Processed tests from {yaml_file}")
+        # One warning for all duplicates rather than one per renamed test
+        if renames:
+            warnings.warn(
+                f"Duplicate test names found: {'; '.join(renames)}.",
+                stacklevel=2
+            )
 
         return combined_config
     
     def pull_image(self, image: str) -> None:
-        """Pull a Docker image from the registry."""
-        print(f"  Pulling image: {image}")
+        """Pull a Docker image from the registry, at most once per orchestrator instance."""
+        with self._pull_locks_guard:
+            lock = self._pull_locks.setdefault(image, threading.Lock())
+
+        with lock:
+            if image in self._pulled_images:
+                return
+
+            # Digest-pinned images are immutable, so a local copy is always current
+            pinned = '@sha256:' in image
+            if pinned:
+                try:
+                    self.client.images.get(image)
+                    log.info("  Using local pinned image: %s", image)
+                    self._pulled_images.add(image)
+                    return
+                except docker.errors.ImageNotFound:
+                    pass
+
+            log.info("  Pulling image: %s", image)
+            try:
+                if not pinned and self._image_is_current(image):
+                    log.info("Image is up to date: %s", image)
+                else:
+                    # Stream the low-level pull instead of letting the SDK collect every progress event.
+                    # The stream is always read to the end so its pooled connection is released.
+                    error = None
+                    up_to_date = False
+                    for event in self.client.api.pull(image, stream=True, decode=True):
+                        if 'error' in event:
+                            error = event['error']
+                        elif 'Image is up to date' in event.get('status', ''):
+                            up_to_date = True
+                    if error:
+                        raise docker.errors.APIError(error)
+                    if up_to_date:
+                        log.info("Image is up to date: %s", image)
+                    else:
+                        log.info("Successfully pulled %s", image)
+            except docker.errors.ImageNotFound:
+                log.warning("  Image not found: %s, will try to use local image if available", image)
+            except Exception as e:
+                log.error("Error pulling image %s: %s", image, e)
+
+            self._pulled_images.add(image)
+    
+    def _image_is_current(self, image: str) -> bool:
+        """Check whether the local copy of an image matches the registry's current manifest digest."""
         try:
-            self.client.images.pull(image)
-            print(f"Successfully pulled {image}")
-        except docker.errors.ImageNotFound:
-            print(f"  Image not found: {image}, will try to use local image if available")
-        except Exception as e:
-            print(f"Error pulling image {image}: {e}")
+            local = self.client.images.get(image)
+            remote = self.client.images.get_registry_data(image)
+        except docker.errors.APIError:
+            return False
+        return any(
+            repo_digest.split('@', 1)[-1] == remote.id
+            for repo_digest in local.attrs.get('RepoDigests', [])
+        )
     
-    def run_test(self, test_name: str, test_image, test_config: Dict[str, Any]) -> str:
-        """Run a single test in a Docker container."""
+    def run_test(self, test_name: str, test_image, test_config: Dict[str, Any],
+                 test_env: Tuple[Dict[str, str], List[str]] = None, network_mode: str = None) -> str:
+        """
+        Run a single test in a Docker container.
+        test_env is the precomputed result of _build_test_env, as stored by
+        load_all_configs; it is built from test_config when not given.
+        network_mode defaults to 'bridge'; 'none' skips network setup for
+        tests that don't need it.
+        """
         image = test_image
         if not image:
             raise ValueError(f"Test '{test_name}' missing required 'image' parameter")
+
+        network_mode = network_mode or 'bridge'
+        if network_mode not in _NETWORK_MODES:
+            raise ValueError(
+                f"Test '{test_name}' has invalid 'network' value {network_mode!r}, "
+                f"expected one of {', '.join(_NETWORK_MODES)}"
+            )
         
-        print(f"\n▶ Running test: {test_name}")
-        print(f"  Image: {image}")
-        
-        self.pull_image(image)
+        log.info("\n▶ Running test: %s", test_name)
+        log.info("  Image: %s", image)
+        log.info("  Network: %s", network_mode)
         
-        # TEST_ prefix separates test parameters from system environment variables
-        env_vars = {
-            'TS_NAME': test_name,
-        }
+        env_vars, secret_names = test_env if test_env is not None else _build_test_env(test_name, test_config)
         
+        # Secrets are resolved at run time so their values never sit in the loaded config
         secret_env_vars = {}
+        for secret_name in secret_names:
+            secret_value = os.getenv(secret_name, '')
+            if not secret_value:
+                log.warning("  Warning: secret '%s' referenced in config but not found in environment", secret_name)
+            secret_env_vars[secret_name] = secret_value
 
-        if test_config:
-            for key, value in test_config.items():
-                if key == 'source_file':
-                    env_vars['SPECIAL_SOURCE_FILE'] = str(value)
-                elif key == 'create-issue':
-                    env_vars['SPECIAL_CREATE_ISSUE'] = 'true' if str(value).lower() == 'true' else 'false'
-                elif isinstance(value, SecretRef):
-                    secret_name = f'SECRET_{value.name}'
-                    secret_value = os.getenv(secret_name, '')
-                    if not secret_value:
-                        print(f"  Warning: secret '{secret_name}' referenced in config but not found in environment")
-                    secret_env_vars[secret_name] = secret_value
-                elif key != 'image':
-                    env_vars[f'TEST_{key.upper()}'] = str(value)
-
-        print(f"  Environment variables: {env_vars}")
+        log.info("  Environment variables: %s", env_vars)
         if secret_env_vars:
-            print(f"  Secret variables: {list(secret_env_vars.keys())} (values redacted)")
-        env_vars.update(secret_env_vars)
+            log.info("  Secret variables: %s (values redacted)", list(secret_env_vars.keys()))
+        env_vars = {**env_vars, **secret_env_vars}
         
         volumes = {
             self.reports_host_path: {
@@ -217,140 +563,264 @@ class TestOrchestrator:
             }
         }
         
-        print(f"  Mounting host path: {self.reports_host_path} -> /reports")
+        log.info("  Mounting host path: %s -> /reports", self.reports_host_path)
         
         try:
-            container = self.client.containers.run(
-                image=image,
-                environment=env_vars,
-                volumes=volumes,
-                detach=False,
-                remove=True,
-                network_mode='bridge'
-            )
+            container_kwargs = {
+                'image': image,
+                'environment': env_vars,
+                'volumes': volumes,
+                'network_mode': network_mode,
+            }
+            try:
+                container = self.client.containers.create(**container_kwargs)
+            except docker.errors.ImageNotFound:
+                self.client.images.pull(image)
+                container = self.client.containers.create(**container_kwargs)
+
+            try:
+                # Register for the exit event before starting so it cannot be missed
+                exit_future = self._exit_watcher.register(container.id) if self._exit_watcher else None
+                container.start()
+                exit_status = self._wait_for_exit(container, exit_future)
+                if exit_status != 0:
+                    # Logs are only fetched for failed containers, and only the tail
+                    stderr = container.logs(stdout=False, stderr=True, tail=_STDERR_TAIL_LINES)[-_STDERR_LOG_LIMIT:]
+                    raise docker.errors.ContainerError(container, exit_status, None, image, stderr)
+            finally:
+                # force also covers containers left running when waiting was interrupted
+                container.remove(force=True)
             
-            print(f"  Container completed successfully")
+            log.info("  Container completed successfully")
             
             report_file = f"{test_name}_report.xml"
             report_path = self.reports_dir / report_file
             
             if report_path.exists():
-                print(f"  Report file found: {report_file}")
+                log.info("  Report file found: %s", report_file)
             else:
-                print(f"  Warning: Report file not found at {report_path}")
-                print(f"  Checking reports directory contents:")
+                log.warning("  Warning: Report file not found at %s", report_path)
+                log.info("  Checking reports directory contents:")
                 try:
                     files = list(self.reports_dir.glob('*.xml'))
                     if files:
-                        print(f"    Found files: {[f.name for f in files]}")
+                        log.info("    Found files: %s", [f.name for f in files])
                     else:
-                        print(f"    No XML files found in {self.reports_dir}")
+                        log.info("    No XML files found in %s", self.reports_dir)
                 except Exception as e:
-                    print(f"    Error listing directory: {e}")
+                    log.error("    Error listing directory: %s", e)
             
             return report_file
             
         except docker.errors.ContainerError as e:
-            print(f"Container failed with exit code {e.exit_status}")
-            print(f"Error: {e.stderr.decode() if e.stderr else 'Unknown error'}")
+            log.error("Container failed with exit code %s", e.exit_status)
+            log.error("Error: %s", e.stderr.decode('utf-8', 'replace') if e.stderr else 'Unknown error')
             raise
         except Exception as e:
-            print(f"Error running container: {e}")
+            log.error("Error running container: %s", e)
             raise
     
-    def combine_reports(self, report_files: List[str]) -> None:
-        """Combine individual jUnit XML reports into a single report using junitparser."""
-        print(f"\n▶ Combining {len(report_files)} reports...")
-        
-        combined = JUnitXml()
-        
-        # Read and combine each report
-        for report_file in report_files:
-            report_path = self.reports_dir / report_file
-            
-            if not report_path.exists():
-                print(f"Warning: Report file not found: {report_file}")
-                continue
-            
+    def _wait_for_exit(self, container, exit_future: Future = None) -> int:
+        """
+        Return the container's exit code, from the event watcher if available.
+        While waiting on the watcher the container's state is checked periodically,
+        so a missed event cannot block the test forever.
+        """
+        if exit_future is not None:
             try:
-                xml = JUnitXml.fromfile(str(report_path))
-                
-                for suite in xml:
-                    combined.add_testsuite(suite)
-                
-                print(f"Merged {report_file}")
-                
-                # Delete individual reports after merge
-                report_path.unlink()
-                print(f"Deleted {report_file}")
-                
-            except Exception as e:
-                print(f"Error processing {report_file}: {e}")
+                while True:
+                    try:
+                        return exit_future.result(timeout=_EXIT_POLL_SECONDS)
+                    except TimeoutError:
+                        container.reload()
+                        if container.status in ('exited', 'dead'):
+                            if self._exit_watcher is not None:
+                                self._exit_watcher.discard(container.id)
+                            return container.attrs['State']['ExitCode']
+            except RuntimeError as e:
+                log.warning("  %s, waiting on container %s directly", e, container.short_id)
+        return container.wait()['StatusCode']
+    
+    def combine_reports(self, report_files: List[str]) -> None:
+        """
+        Combine individual jUnit XML reports into a single report.
+        Test suites are streamed from each report with lxml's iterparse and written
+        straight to the combined report, so only one suite is held in memory at a time.
+        Only this run's reports are read; an existing combined report is replaced,
+        never appended to, so results from earlier runs don't leak into it.
+        """
+        log.info("\n▶ Combining %s reports...", len(report_files))
         
         combined_report = self.reports_dir / 'combined_report.xml'
-        combined.write(str(combined_report), pretty=True)
+        total_tests = total_failures = total_errors = total_skipped = 0
+        total_time = 0.0
         
-        # Calculate and display summary
-        total_tests = combined.tests
-        total_failures = combined.failures
-        total_skipped = combined.skipped
-        total_errors = combined.errors
-        total_time = combined.time
+        with open(combined_report, 'wb', buffering=_REPORT_IO_BUFFER_SIZE) as out, \
+                etree.xmlfile(out, encoding='utf-8') as xf:
+            xf.write_declaration()
+            with xf.element('testsuites'):
+                xf.write('\n')
+                
+                # Read and combine each report
+                for report_file in report_files:
+                    report_path = self.reports_dir / report_file
+                    
+                    if not report_path.exists():
+                        log.warning("Warning: Report file not found: %s", report_file)
+                        continue
+                    
+                    try:
+                        with open(report_path, 'rb', buffering=_REPORT_IO_BUFFER_SIZE) as report:
+                            # Reports come from test containers: never resolve entities or fetch anything
+                            for _, suite in etree.iterparse(
+                                report,
+                                tag='testsuite',
+                                remove_blank_text=True,
+                                resolve_entities=False,
+                                no_network=True,
+                            ):
+                                # Nested suites are written as part of their top-level suite
+                                parent = suite.getparent()
+                                if parent is not None and parent.tag != 'testsuites':
+                                    continue
+                                
+                                # Drop unresolved entity references, which would be undefined in the combined report
+                                etree.strip_elements(suite, etree.Entity, with_tail=False)
+                                
+                                # Count from the test cases, including those of nested suites
+                                for case in suite.iter('testcase'):
+                                    total_tests += 1
+                                    total_time += float(case.get('time') or 0)
+                                    for result in case:
+                                        if result.tag == 'failure':
+                                            total_failures += 1
+                                        elif result.tag == 'error':
+                                            total_errors += 1
+                                        elif result.tag == 'skipped':
+                                            total_skipped += 1
+                                
+                                xf.write(suite, pretty_print=True, with_tail=False)
+                                
+                                # Free the suite and any already-written siblings
+                                suite.clear()
+                                while suite.getprevious() is not None:
+                                    del suite.getparent()[0]
+                        
+                        log.info("Merged %s", report_file)
+                        
+                        # Delete individual reports after merge
+                        report_path.unlink()
+                        log.info("Deleted %s", report_file)
+                        
+                    except Exception as e:
+                        log.error("Error processing %s: %s", report_file, e)
         
-        print(f"Combined report saved to: {combined_report}")
-        print(f"Summary: {total_tests} tests, {total_failures} failures, {total_errors} errors, {total_skipped} skipped, {total_time:.3f}s")
+        log.info("Combined report saved to: %s", combined_report)
+        log.info("Summary: %s tests, %s failures, %s errors, %s skipped, %.3fs", total_tests, total_failures, total_errors, total_skipped, total_time)
     
     def run(self) -> None:
         """Main orchestrator execution flow."""
-        print("=" * 60)
-        print("Test Suite Orchestrator - Starting")
-        print("=" * 60)
-        print(f"Reports directory (container): {self.reports_dir}")
-        print(f"Reports directory (host): {self.reports_host_path}")
-        print("=" * 60)
+        log.info("=" * 60)
+        log.info("Test Suite Orchestrator - Starting")
+        log.info("=" * 60)
+        log.info("Reports directory (container): %s", self.reports_dir)
+        log.info("Reports directory (host): %s", self.reports_host_path)
+        log.info("=" * 60)
         
         try:
             config = self.load_all_configs()
             
             tests = config.get('tests', {})
             if not tests:
-                print("No tests found in configuration")
+                log.info("No tests found in configuration")
                 return
             
-            print(f"\nFound {len(tests)} test(s) to execute")
+            log.info("\nFound %s test(s) to execute", len(tests))
+
+            # Pull each distinct image once, up front
+            images = {test_config['image'] for test_config in tests.values() if test_config.get('image')}
+            if images:
+                with ThreadPoolExecutor(max_workers=min(8, len(images))) as executor:
+                    list(executor.map(self.pull_image, images))
             
-            # Run each test and collect report filenames
-            report_files = []
-            for test_name, test_config in tests.items():
-                try:
-                    test_image = test_config.get('image')
-                    test_config_values = test_config.get('config', {})
-                    report_file = self.run_test(test_name, test_image, test_config_values)
-                    report_files.append(report_file)
-                except Exception as e:
-                    print(f"Test '{test_name}' failed: {e}")
+            # Watch container exits through one event stream rather than a wait() per test
+            try:
+                self._exit_watcher = _ContainerExitWatcher(self.client)
+            except Exception as e:
+                log.warning("Could not subscribe to Docker events, waiting on containers directly: %s", e)
             
-            # Wait a moment for files to be written
-            time.sleep(1)
+            # Run tests concurrently and collect report filenames
+            results: Dict[str, str] = {}
+            try:
+                with ThreadPoolExecutor(max_workers=self.max_parallel) as executor:
+                    futures = {
+                        executor.submit(
+                            self.run_test,
+                            test_name,
+                            test_config.get('image'),
+                            test_config.get('config', {}),
+                            test_config.get('_env'),
+                            test_config.get('network'),
+                        ): test_name
+                        for test_name, test_config in tests.items()
+                    }
+                    for future in as_completed(futures):
+                        test_name = futures[future]
+                        try:
+                            results[test_name] = future.result()
+                        except docker.errors.ContainerError as e:
+                            # run_test has already logged the container's stderr
+                            log.error("Test '%s' failed: container exited with code %s", test_name, e.exit_status)
+                        except Exception as e:
+                            log.error("Test '%s' failed: %s", test_name, e)
+            finally:
+                if self._exit_watcher is not None:
+                    self._exit_watcher.close()
+                    self._exit_watcher = None
+
+            # Keep reports in configuration order, not completion order
+            report_files = [results[test_name] for test_name in tests if test_name in results]
             
             if report_files:
                 self.combine_reports(report_files)
             else:
-                print("\n No reports to combine")
+                log.info("\n No reports to combine")
             
-            print("\n" + "=" * 60)
-            print("Test Suite Orchestrator - Completed")
-            print("=" * 60)
+            log.info("\n" + "=" * 60)
+            log.info("Test Suite Orchestrator - Completed")
+            log.info("=" * 60)
             
         except Exception as e:
-            print(f"\n Orchestrator failed: {e}")
+            log.error("\n Orchestrator failed: %s", e)
             raise
 
 
+def _start_logging() -> QueueListener:
+    """
+    Send log records through a queue drained by a single writer thread,
+    so concurrent tests don't contend on stdout.
+    """
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = QueueListener(log_queue, handler)
+
+    log.addHandler(QueueHandler(log_queue))
+    log.setLevel(logging.INFO)
+    log.propagate = False
+
+    listener.start()
+    return listener
+
+
 def main():
     """Entry point for the orchestrator."""
-    orchestrator = TestOrchestrator()
-    orchestrator.run()
+    listener = _start_logging()
+    try:
+        orchestrator = TestOrchestrator()
+        orchestrator.run()
+    finally:
+        listener.stop()
 
 if __name__ == '__main__':
     main()
\ No newline at end of file